@@ -10,23 +10,14 @@ setup(
 
     packages=find_packages(include=['skillcorner_analysis_toolkit', 'skillcorner_analysis_toolkit.*']),
 
-    package_data={'skillcorner_analysis_toolkit': ['resources/Roboto/Roboto-Black.ttf',
-                                                   'resources/Roboto/Roboto-BlackItalic.ttf',
-                                                   'resources/Roboto/Roboto-Bold.ttf',
-                                                   'resources/Roboto/Roboto-BoldItalic.ttf',
-                                                   'resources/Roboto/Roboto-Italic.ttf',
-                                                   'resources/Roboto/Roboto-Light.ttf',
-                                                   'resources/Roboto/Roboto-LightItalic.ttf',
-                                                   'resources/Roboto/Roboto-Medium.ttf',
-                                                   'resources/Roboto/Roboto-MediumItalic.ttf',
-                                                   'resources/Roboto/Roboto-Regular.ttf',
-                                                   'resources/Roboto/Roboto-Thin.ttf',
-                                                   'resources/Roboto/Roboto-ThinItalic.ttf']},
-
     include_package_data=True,
-    install_requires=['adjustText==0.7.3',
-                      'matplotlib==3.7.2',
-                      'numpy==1.24.2',
-                      'pandas==1.5.3',
-                      'seaborn==0.11.2'],
+    python_requires='>=3.9',
+    install_requires=['adjustText>=1.0',
+                      'matplotlib>=3.7',
+                      'numpy>=1.24',
+                      'pandas>=1.5',
+                      'seaborn>=0.11'],
+    extras_require={'polars': ['polars>=1.23'],
+                    'numba': ['numba'],
+                    'fast-labels': ['textalloc']},
 )
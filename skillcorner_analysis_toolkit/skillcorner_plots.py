@@ -28,13 +28,14 @@ and y-axis (`y_metric`), the categorical values to include on the y-axis
 highlighting specific data points.
 """
 
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import font_manager as fm
+from matplotlib.colors import to_rgba
+from matplotlib.collections import LineCollection
 from matplotlib.ticker import EngFormatter
 import matplotlib.patheffects as pe
-from adjustText import adjust_text
-import seaborn as sns
-from pkg_resources import resource_filename
+from importlib.resources import files
 
 fonts = ['resources/Roboto/Roboto-Black.ttf',
          'resources/Roboto/Roboto-BlackItalic.ttf',
@@ -49,12 +50,43 @@ fonts = ['resources/Roboto/Roboto-Black.ttf',
          'resources/Roboto/Roboto-Thin.ttf',
          'resources/Roboto/Roboto-ThinItalic.ttf']
 
-for f in fonts:
-    filepath = resource_filename('skillcorner_analysis_toolkit', f)
-    fm.fontManager.addfont(filepath)
+# Registering the fonts once per process. Re-imports (e.g. notebook autoreload)
+# skip registration, as do fonts matplotlib already knows about, since addfont
+# clears matplotlib's font lookup cache.
+if not getattr(fm.fontManager, '_skillcorner_fonts_loaded', False):
+    registered = {font.fname for font in fm.fontManager.ttflist}
+    for f in fonts:
+        filepath = str(files('skillcorner_analysis_toolkit') / f)
+        if filepath not in registered:
+            fm.fontManager.addfont(filepath)
+    fm.fontManager._skillcorner_fonts_loaded = True
 plt.rcParams["font.family"] = "Roboto"
 
 
+# Gets a boolean mask of which ids are in a highlight group. The group is
+# converted to a set once, so each lookup is O(1).
+def _get_group_mask(ids, group):
+    group = set(group)
+    return np.fromiter((x in group for x in ids), dtype=bool, count=len(ids))
+
+
+# Sets an engineering unit formatter on an axis, if a unit is given. A new
+# formatter is made for each axis, as formatters keep per-axis state and
+# cannot be shared between axes.
+def _set_unit_formatter(axis, unit):
+    if unit is not None:
+        axis.set_major_formatter(EngFormatter(unit=unit))
+
+
+# Gets the figure & axes to plot on. A new figure is made unless axes are
+# given, in which case they are cleared so a figure can be reused in a loop.
+def _get_figure_and_axes(ax, figsize):
+    if ax is None:
+        return plt.subplots(figsize=figsize)
+    ax.clear()
+    return ax.figure, ax
+
+
 def plot_bar_chart(df,
                    x_metric,
                    x_label=None,
@@ -67,7 +99,8 @@ def plot_bar_chart(df,
                    data_point_label='player_name',
                    plot_title=None,
                    base_color='#80CBA2',
-                   figsize=(8, 4)):
+                   figsize=(8, 4),
+                   ax=None):
     """
     Plot a bar chart using the given data.
 
@@ -99,6 +132,10 @@ def plot_bar_chart(df,
         The base color for the bars (default: '#80CBA2').
     figsize : tuple, optional
         Tuple (x, y) that defines the dimensions of the figure (default: (8, 4)).
+        Ignored when ax is given.
+    ax : matplotlib.axes.Axes, optional
+        Existing axes to clear & plot on, e.g. to reuse one figure across many plots.
+        The caller is responsible for closing that figure with plt.close(fig).
 
     Returns
     -------
@@ -119,47 +156,63 @@ def plot_bar_chart(df,
         secondary_highlight_group = []
 
     # Setting plot size & background.
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _get_figure_and_axes(ax, figsize)
     fig.patch.set_facecolor('white')
     ax.set_facecolor('white')
 
-    # Sorting the dataframe based on the metric to plot.
-    df = df.sort_values(by=x_metric)
+    # Sorting the plotted columns based on the metric to plot. Only the columns
+    # used are reordered, rather than copying the whole DataFrame.
+    x_values = df[x_metric].to_numpy()
+    order = np.argsort(x_values, kind='stable')
+    x_values = x_values[order]
+    labels = df[data_point_label].to_numpy()[order]
     y_pos = range(0, len(df))
 
+    # Getting which bars to highlight once, rather than per bar. The highlight
+    # steps below are skipped entirely when there is nothing to highlight.
+    has_highlights = len(primary_highlight_group) > 0 or len(secondary_highlight_group) > 0
+    if has_highlights:
+        ids = df[data_point_id].to_numpy()[order]
+        primary_mask = _get_group_mask(ids, primary_highlight_group)
+        highlight_mask = primary_mask | _get_group_mask(ids, secondary_highlight_group)
+
+    # Setting bar colours. Players in the comparison_players or target_players
+    # are highlighted, with target_players in the primary colour.
+    if has_highlights:
+        bar_colors = np.tile(to_rgba(base_color), (len(x_values), 1))
+        bar_colors[highlight_mask] = to_rgba(secondary_highlight_color)
+        bar_colors[primary_mask] = to_rgba(primary_highlight_color)
+    else:
+        bar_colors = base_color
+
     # Plotting bars.
-    bars = ax.barh(y_pos,
-                   df[x_metric],
-                   color=base_color,
-                   edgecolor='#0C1B37',
-                   lw=0.5,
-                   zorder=3,
-                   alpha=1)
-
-    # Looping through data & bars to highlight specific players.
-    for i, bar in zip(y_pos, bars):
-        # If the player has been included in the comparison_players or target_players
-        if df[data_point_id].iloc[i] in secondary_highlight_group or \
-                df[data_point_id].iloc[i] in primary_highlight_group:
-            ax.axhline(i,
-                       color='white',
-                       zorder=1,
-                       linewidth=1)
-            ax.axhline(i,
-                       color='#0C1B37',
-                       zorder=2,
-                       linestyle='--',
-                       linewidth=0.75)
-
-            bar.set_color(secondary_highlight_color)
-
-        # If the player has been included in the target_players
-        if df[data_point_id].iloc[i] in primary_highlight_group:
-            bar.set_color(primary_highlight_color)
-
-        # Apply to all bars.
-        bar.set_edgecolor('#0C1B37')
-        bar.set_linewidth(0.5)
+    ax.barh(y_pos,
+            x_values,
+            color=bar_colors,
+            edgecolor='#0C1B37',
+            lw=0.5,
+            zorder=3,
+            alpha=1)
+
+    # Adding lines behind highlighted players. Each style is drawn as one
+    # collection spanning the axes width, like axhline.
+    if has_highlights:
+        line_segments = np.zeros((np.count_nonzero(highlight_mask), 2, 2))
+        line_segments[:, 1, 0] = 1
+        line_segments[:, :, 1] = np.flatnonzero(highlight_mask)[:, None]
+        ax.add_collection(LineCollection(line_segments,
+                                         transform=ax.get_yaxis_transform(),
+                                         colors='white',
+                                         zorder=1,
+                                         linewidths=1),
+                          autolim=False)
+        ax.add_collection(LineCollection(line_segments,
+                                         transform=ax.get_yaxis_transform(),
+                                         colors='#0C1B37',
+                                         zorder=2,
+                                         linestyles='--',
+                                         linewidths=0.75),
+                          autolim=False)
 
     # Setting x label.
     ax.set_xlabel(x_label,
@@ -184,23 +237,20 @@ def plot_bar_chart(df,
 
     # Setting y ticks to player names.
     ax.set_yticks(y_pos)
-    ax.set_yticklabels(df[data_point_label])
+    ax.set_yticklabels(labels)
 
     # Setting player names for those in comparison or target groups to bold.
-    for i, tick_label in enumerate(ax.get_yticklabels()):
-        if df[data_point_id].iloc[i] in secondary_highlight_group or \
-                df[data_point_id].iloc[i] in primary_highlight_group:
-            tick_label.set_fontproperties({'weight': 'bold', 'size': 7})
-        else:
-            tick_label.set_fontproperties({'size': 7})
+    if has_highlights:
+        bold_font = {'weight': 'bold', 'size': 7}
+        regular_font = {'size': 7}
+        for tick_label, is_highlight in zip(ax.get_yticklabels(), highlight_mask):
+            tick_label.set_fontproperties(bold_font if is_highlight else regular_font)
 
     ax.yaxis.label.set_color('#0C1B37')
     ax.xaxis.label.set_color('#0C1B37')
 
     # If an x_unit has been specified, apply it to the x-axis.
-    if x_unit is not None:
-        formatter0 = EngFormatter(unit=x_unit)
-        ax.xaxis.set_major_formatter(formatter0)
+    _set_unit_formatter(ax.xaxis, x_unit)
 
     # Add grid.
     ax.grid(color='#0C1B37',
@@ -216,7 +266,7 @@ def plot_bar_chart(df,
     for k, spine in ax.spines.items():
         spine.set_zorder(10)
 
-    plt.tight_layout()
+    fig.tight_layout()
     plt.show()
 
     return fig, ax
@@ -228,7 +278,8 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
                  primary_highlight_group=None, secondary_highlight_group=None,
                  primary_highlight_color='#EE7A6F', secondary_highlight_color='#F6C243',
                  data_point_id='player_name', data_point_label='player_name',
-                 base_color='#80CBA2', avg_line=True, figsize=(8, 4)):
+                 base_color='#80CBA2', avg_line=True, figsize=(8, 4),
+                 label_iter_lim=None, ax=None):
     """
     Plots a scatter plot based on the provided data and configuration.
 
@@ -255,11 +306,18 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
         base_color (str, optional): The base color for the scatter plot. Defaults to '#80CBA2'.
         avg_line (bool, optional): Whether to display average lines. Defaults to True.
         figsize (tuple, optional): The figure size of the plot. Defaults to (8, 4).
+        label_iter_lim (int, optional): The maximum number of adjust_text iterations used to place labels.
+            Defaults to None, which uses 20 for fewer than 8 labels and 50 otherwise.
+        ax (Axes, optional): Existing axes to clear & plot on, e.g. to reuse one figure across many plots.
+            The caller is responsible for closing that figure with plt.close(fig). Defaults to None.
 
     Returns:
         fig, ax: The Matplotlib figure and axis objects.
     """
 
+    # Imported here rather than at module level, to keep the module import light.
+    from adjustText import adjust_text
+
     if x_label is None:
         x_label = x_metric
 
@@ -272,7 +330,7 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
         primary_highlight_group = []
 
     # Setting plot size & background.
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _get_figure_and_axes(ax, figsize)
     fig.patch.set_facecolor('white')
     ax.set_facecolor('white')
 
@@ -281,15 +339,19 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
         sum_minutes_played = (df['minutes_played_per_match'] * df['count_match']) / 10
         df = df.assign(sum_minutes_played=sum_minutes_played)
     if z_metric is not None:
-        old_max = df[z_metric].max()
-        old_min = df[z_metric].min()
+        z = df[z_metric].to_numpy(dtype=np.float64, na_value=np.nan)
+        old_max = np.nanmax(z)
+        old_min = np.nanmin(z)
         new_max = 300
         new_min = 50
 
         old_range = (old_max - old_min)
         new_range = (new_max - new_min)
 
-        sizes = (((df[z_metric] - old_min) * new_range) / old_range) + new_min
+        # Rescaling in place into one buffer to avoid intermediate arrays.
+        sizes = np.subtract(z, old_min)
+        sizes *= new_range / old_range
+        sizes += new_min
         df = df.assign(size=sizes)
     else:
         df = df.assign(size=100)
@@ -297,25 +359,35 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
     if z_metric is not None and z_label is None:
         z_label = z_metric
 
-    # Filtering data points based on standard deviation factors.
-    if x_sd_highlight is not None:
-        label_group = df[(df[x_metric] > df[x_metric].mean() + (x_sd_highlight * df[x_metric].std())) |
-                         (df[y_metric] > df[y_metric].mean() + (y_sd_highlight * df[y_metric].std())) |
-                         (df[data_point_id].isin(secondary_highlight_group)) |
-                         (df[data_point_id].isin(primary_highlight_group))]
+    # Computing the summary statistics once, for the filters, lines & legend.
+    x_mean, x_std = df[x_metric].mean(), df[x_metric].std()
+    y_mean, y_std = df[y_metric].mean(), df[y_metric].std()
+    size_mean, size_std = df['size'].mean(), df['size'].std()
 
-    # If not, get any players specified in the comparison_players or target_players.
+    # Nothing to label when there are no highlight groups or SD highlights.
+    if x_sd_highlight is None and len(primary_highlight_group) == 0 and len(secondary_highlight_group) == 0:
+        label_group = df.iloc[:0]
     else:
-        label_group = df[(df[data_point_id].isin(secondary_highlight_group)) |
-                         (df[data_point_id].isin(primary_highlight_group))]
+        # Getting the highlight groups once, for both the label filter & colours.
+        ids = df[data_point_id].to_numpy()
+        primary_mask = _get_group_mask(ids, primary_highlight_group)
+        secondary_mask = _get_group_mask(ids, secondary_highlight_group)
+
+        # Label any players specified in the comparison_players or target_players.
+        label_mask = primary_mask | secondary_mask
+
+        # Also label data points based on standard deviation factors.
+        if x_sd_highlight is not None:
+            label_mask |= ((df[x_metric] > x_mean + (x_sd_highlight * x_std)) |
+                           (df[y_metric] > y_mean + (y_sd_highlight * y_std))).to_numpy()
 
-    # Set style parameters for label_group.
-    label_group = label_group.assign(colour=base_color)
-    label_group.loc[label_group[data_point_id].isin(secondary_highlight_group), 'colour'] = secondary_highlight_color
-    label_group.loc[label_group[data_point_id].isin(primary_highlight_group), 'colour'] = primary_highlight_color
-    label_group = label_group.assign(fontweight='bold')
-    label_group.loc[label_group[data_point_id].isin(secondary_highlight_group), 'fontweight'] = 'bold'
-    label_group.loc[label_group[data_point_id].isin(primary_highlight_group), 'fontweight'] = 'bold'
+        label_group = df[label_mask]
+
+        # Set style parameters for label_group. Primary takes precedence over secondary.
+        label_group = label_group.assign(colour=np.select([primary_mask[label_mask], secondary_mask[label_mask]],
+                                                          [primary_highlight_color, secondary_highlight_color],
+                                                          default=base_color),
+                                         fontweight='bold')
 
     # Plotting scatters. Note the default size reflects the total minutes played.
     ax.scatter(df[x_metric],
@@ -327,44 +399,48 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
                s=df['size'],
                zorder=4)
 
-    ax.scatter(label_group[x_metric],
-               label_group[y_metric],
-               c=label_group['colour'],
-               edgecolor='#0C1B37',
-               alpha=1,
-               lw=0.5,
-               s=label_group['size'],
-               zorder=5)
-
-    # Adding player_name texts for label group.
+    # Plotting the label group & adding player_name texts.
     if len(label_group) > 0:
-        texts = [ax.text(label_group[x_metric].iloc[i],
-                         label_group[y_metric].iloc[i],
-                         str(label_group[data_point_label].iloc[i]),
-                         color='#0C1B37',
-                         fontsize=6,
-                         fontweight=label_group['fontweight'].iloc[i],
-                         zorder=6,
-                         path_effects=[pe.withStroke(linewidth=1.5,
-                                                     foreground='white',
-                                                     alpha=1)]
-                         ) for i in range(len(label_group))]
-
-        # Plotting texts using adjust_text to manage spacing/overlaps.
-        adjust_text(texts, ax=ax, expand_points=(1.5, 1.5),
-                    force_text=.5,
-                    force_points=.5,
-                    ha='left',
-                    arrowprops=dict(arrowstyle="-",
-                                    color='#0C1B37',
-                                    alpha=1,
-                                    lw=0.5, zorder=6))
+        ax.scatter(label_group[x_metric],
+                   label_group[y_metric],
+                   c=label_group['colour'],
+                   edgecolor='#0C1B37',
+                   alpha=1,
+                   lw=0.5,
+                   s=label_group['size'],
+                   zorder=5)
+
+        # Sharing one set of text styles & path effects across all texts.
+        text_style = dict(color='#0C1B37',
+                          fontsize=6,
+                          ha='left',
+                          zorder=6,
+                          path_effects=[pe.withStroke(linewidth=1.5,
+                                                      foreground='white',
+                                                      alpha=1)])
+        rows = label_group[[x_metric, y_metric, data_point_label, 'fontweight']].itertuples(index=False)
+        texts = [ax.text(x, y, str(label), fontweight=fontweight, **text_style)
+                 for x, y, label, fontweight in rows]
+
+        # Plotting texts using adjust_text to manage spacing/overlaps. A single
+        # label has nothing to overlap, so it is left next to its point.
+        if len(texts) > 1:
+            if label_iter_lim is None:
+                label_iter_lim = 20 if len(texts) < 8 else 50
+            adjust_text(texts, ax=ax, expand=(1.5, 1.5),
+                        force_text=.5,
+                        force_static=.5,
+                        iter_lim=label_iter_lim,
+                        arrowprops=dict(arrowstyle="-",
+                                        color='#0C1B37',
+                                        alpha=1,
+                                        lw=0.5, zorder=6))
 
     # Add average lines.
     if avg_line == True:
-        ax.axvline(df[x_metric].mean(),
+        ax.axvline(x_mean,
                    color='#0C1B37', alpha=0.6, lw=1, linestyle='--', zorder=3, label='Average')
-        ax.axhline(df[y_metric].mean(),
+        ax.axhline(y_mean,
                    color='#0C1B37', alpha=0.6, lw=1, linestyle='--', zorder=3)
 
     # Setting x & y labels.
@@ -382,13 +458,8 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
     ax.tick_params(axis='y', colors='#0C1B37', labelsize=7, length=0)
 
     # Adding units if they have been specified.
-    if x_unit != None:
-        formatter0 = EngFormatter(unit=x_unit)
-        ax.xaxis.set_major_formatter(formatter0)
-
-    if y_unit != None:
-        formatter1 = EngFormatter(unit=y_unit)
-        ax.yaxis.set_major_formatter(formatter1)
+    _set_unit_formatter(ax.xaxis, x_unit)
+    _set_unit_formatter(ax.yaxis, y_unit)
 
     # Adding annotation to plot corners.
     # Extending the plot limits to avoid annotating over player scatters.
@@ -404,49 +475,20 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
         xmin, xmax = ax.get_xlim()
         ymin, ymax = ax.get_ylim()
 
-        # Bottom left.
-        ax.text(xmin, ymin,
-                r" $\bf{Low}$ " + y_annotation + '\n' + r" $\bf{Low}$ " + x_annotation,
-                ha='left',
-                va='bottom',
-                color='#0C1B37',
-                fontsize=6,
-                fontweight='regular',
-                path_effects=[pe.withStroke(linewidth=1.5,
-                                            foreground='white',
-                                            alpha=1)])
-        # Top left.
-        ax.text(xmin, ymax,
-                r" $\bf{High}$ " + y_annotation + '\n' + r" $\bf{Low}$ " + x_annotation,
-                ha='left',
-                va='top',
-                color='#0C1B37',
-                fontsize=6,
-                fontweight='regular',
-                path_effects=[pe.withStroke(linewidth=1.5,
-                                            foreground='white',
-                                            alpha=1)])
-        # Bottom right.
-        ax.text(xmax, ymin,
-                r"$\bf{Low}$ " + y_annotation + '\n' + r"$\bf{High}$ " + x_annotation,
-                ha='right',
-                va='bottom',
-                color='#0C1B37',
-                fontsize=6,
-                fontweight='regular',
-                path_effects=[pe.withStroke(linewidth=1.5,
-                                            foreground='white',
-                                            alpha=1)])
-        # Top right.
-        ax.text(xmax, ymax,
-                r"$\bf{High}$ " + y_annotation + '\n' + r"$\bf{High}$ " + x_annotation,
-                ha='right',
-                va='top',
-                color='#0C1B37',
-                fontsize=6,
-                path_effects=[pe.withStroke(linewidth=1.5,
-                                            foreground='white',
-                                            alpha=1)])
+        # Sharing one set of text styles & path effects across the corners.
+        annotation_style = dict(color='#0C1B37',
+                                fontsize=6,
+                                fontweight='regular',
+                                path_effects=[pe.withStroke(linewidth=1.5,
+                                                            foreground='white',
+                                                            alpha=1)])
+        # Bottom left, top left, bottom right & top right.
+        corners = [(xmin, ymin, 'left', 'bottom', r" $\bf{Low}$ " + y_annotation + '\n' + r" $\bf{Low}$ " + x_annotation),
+                   (xmin, ymax, 'left', 'top', r" $\bf{High}$ " + y_annotation + '\n' + r" $\bf{Low}$ " + x_annotation),
+                   (xmax, ymin, 'right', 'bottom', r"$\bf{Low}$ " + y_annotation + '\n' + r"$\bf{High}$ " + x_annotation),
+                   (xmax, ymax, 'right', 'top', r"$\bf{High}$ " + y_annotation + '\n' + r"$\bf{High}$ " + x_annotation)]
+        for x, y, ha, va, body in corners:
+            ax.text(x, y, body, ha=ha, va=va, **annotation_style)
 
     # Organising plot legend.
     # Adding empty legend handles & labels that reflect scatter size.
@@ -457,13 +499,13 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
         ax.scatter([], [], c='white', s=5,
                    lw=0.5, edgecolor='white', zorder=3,
                    label=z_label + ':\n')
-        ax.scatter([], [], c='white', s=df['size'].mean() + (1.5 * df['size'].std()),
+        ax.scatter([], [], c='white', s=size_mean + (1.5 * size_std),
                    lw=0.5, edgecolor='black', zorder=3,
                    label='High')
-        ax.scatter([], [], c='white', s=df['size'].mean(),
+        ax.scatter([], [], c='white', s=size_mean,
                    lw=0.5, edgecolor='black', zorder=3,
                    label='Average')
-        ax.scatter([], [], c='white', s=df['size'].mean() - (1.5 * df['size'].std()),
+        ax.scatter([], [], c='white', s=size_mean - (1.5 * size_std),
                    lw=0.5, edgecolor='black', zorder=3,
                    label='Low')
 
@@ -478,7 +520,7 @@ def plot_scatter(df, x_metric, y_metric, z_metric=None, x_label=None, y_label=No
 
     ax.grid(axis='both', color='#0C1B37', alpha=0.2, lw=.5, linestyle='--', )
 
-    plt.tight_layout()
+    fig.tight_layout()
     plt.show()
 
     return fig, ax
@@ -498,7 +540,8 @@ def plot_swarm_violin(df,
                       base_colour='#80CBA2',
                       primary_highlight_color='#EE7A6F',
                       secondary_highlight_color='#F6C243',
-                      figsize=(8, 4)):
+                      figsize=(8, 4),
+                      ax=None):
     """
     Plots a swarm/violin plot.
 
@@ -533,7 +576,10 @@ def plot_swarm_violin(df,
     secondary_highlight_color : str, optional
         The highlight color for the secondary highlight group.
     figsize : tuple, optional
-        The size of the figure (width, height).
+        The size of the figure (width, height). Ignored when ax is given.
+    ax : Axes, optional
+        Existing axes to clear & plot on, e.g. to reuse one figure across many plots.
+        The caller is responsible for closing that figure with plt.close(fig).
 
     Returns:
     --------
@@ -543,6 +589,12 @@ def plot_swarm_violin(df,
         The axes of the generated plot.
     """
 
+    # Imported here rather than at module level, to keep the module import light.
+    import seaborn as sns
+    from adjustText import adjust_text
+
+    # When y_groups are taken from the data, every row is kept.
+    filter_y_groups = y_groups is not None
     if y_groups is None:
         y_groups = list(df[y_metric].unique())
 
@@ -559,21 +611,25 @@ def plot_swarm_violin(df,
         secondary_highlight_group = []
 
     # Removing unseemly categories in the y_value column.
-    plot_data = df[df[y_metric].isin(y_groups)]
+    if filter_y_groups:
+        plot_data = df[df[y_metric].isin(y_groups)]
+    else:
+        plot_data = df
 
     # Setting size & face colors.
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _get_figure_and_axes(ax, figsize)
     fig.patch.set_facecolor('white')
     ax.set_facecolor('white')
 
-    # Plotting violins.
-    violin_parts = sns.violinplot(data=plot_data,
+    # Plotting violins, passing seaborn only the columns it plots.
+    violin_parts = sns.violinplot(data=plot_data[[x_metric, y_metric]],
                                   x=x_metric,
                                   y=y_metric,
                                   order=y_groups,
                                   inner=None,
                                   width=1,
-                                  zorder=5)
+                                  zorder=5,
+                                  ax=ax)
 
     # Setting the style for each violin.
     for pc in violin_parts.collections:
@@ -583,14 +639,16 @@ def plot_swarm_violin(df,
         pc.set_alpha(0.1)
 
     # Setting swarm groups: background_players, comparison_players, target_player.
-    plot_data = plot_data.assign(swarm_group='background_group')
-    plot_data = plot_data.assign(colour=base_colour)
-
-    plot_data.loc[plot_data[data_point_id].isin(primary_highlight_group), 'swarm_group'] = 'primary_highlight_group'
-    plot_data.loc[plot_data[data_point_id].isin(primary_highlight_group), 'colour'] = primary_highlight_color
-
-    plot_data.loc[plot_data[data_point_id].isin(secondary_highlight_group), 'swarm_group'] = 'secondary_highlight_group'
-    plot_data.loc[plot_data[data_point_id].isin(secondary_highlight_group), 'colour'] = secondary_highlight_color
+    # The secondary group takes precedence over the primary group.
+    ids = plot_data[data_point_id].to_numpy()
+    swarm_masks = [_get_group_mask(ids, secondary_highlight_group),
+                   _get_group_mask(ids, primary_highlight_group)]
+    plot_data = plot_data.assign(swarm_group=np.select(swarm_masks,
+                                                       ['secondary_highlight_group', 'primary_highlight_group'],
+                                                       default='background_group'),
+                                 colour=np.select(swarm_masks,
+                                                  [secondary_highlight_color, primary_highlight_color],
+                                                  default=base_colour))
 
     sns.set_palette([secondary_highlight_color, primary_highlight_color])
     hue_order = ['secondary_highlight_group', 'primary_highlight_group']
@@ -598,7 +656,7 @@ def plot_swarm_violin(df,
     plot_data = plot_data.sort_values(by=data_point_id)
 
     # Plotting swarm plot.
-    sns.swarmplot(data=plot_data,
+    sns.swarmplot(data=plot_data[[x_metric, y_metric]],
                   x=x_metric,
                   y=y_metric,
                   order=y_groups,
@@ -606,11 +664,13 @@ def plot_swarm_violin(df,
                   alpha=1,
                   size=6.5 - (len(y_groups)),
                   edgecolor='#0C1B37',
-                  linewidth=0.1)
+                  linewidth=0.1,
+                  ax=ax)
 
     # Plotting swarm plot for highlight data points (larger scatter size).
     if len(primary_highlight_group) > 0 or len(secondary_highlight_group) > 0:
-        swarmplots = sns.swarmplot(data=plot_data[plot_data['swarm_group'] != 'background_group'],
+        highlight_data = plot_data[plot_data['swarm_group'] != 'background_group']
+        swarmplots = sns.swarmplot(data=highlight_data[[x_metric, y_metric, 'swarm_group']],
                                    x=x_metric,
                                    y=y_metric,
                                    order=y_groups,
@@ -620,50 +680,49 @@ def plot_swarm_violin(df,
                                    size=10 - (len(y_groups)),
                                    edgecolor='#0C1B37',
                                    linewidth=0.3,
-                                   zorder=4)
+                                   zorder=4,
+                                   ax=ax)
 
         # Plotting player names for those specified in target or comparison players.
         # Get the positions of the swarm plot on the axis.
         artists = ax.get_children()
         swarmplot_positions = list(range(len(y_groups) * 2, len(y_groups) * 3))
 
+        # Splitting the highlighted data points by group once, sorted by x_metric.
+        label_groups = dict(list(highlight_data.sort_values(by=x_metric, ascending=True)
+                                 .groupby(y_metric, sort=False, observed=True)))
+
+        # Sharing one set of text styles & path effects across all texts.
+        text_style = dict(color='#0C1B37',
+                          fontsize=5,
+                          fontweight='bold',
+                          zorder=6,
+                          path_effects=[pe.withStroke(linewidth=1,
+                                                      foreground='white',
+                                                      alpha=1)])
+
         for i, group in zip(swarmplot_positions, y_groups):
             # Get the data for specific swarm plot.
-            group_df = plot_data[plot_data[y_metric] == group].sort_values(by=x_metric, ascending=True).reset_index()
-            label_df = group_df[group_df['swarm_group'] != 'background_group'].reset_index()
+            label_df = label_groups.get(group, highlight_data.iloc[:0]).reset_index()
 
             # Match the data points to their jitter y position in the swarm plot.
-            offsets = swarmplots.collections[i].get_offsets()
+            offsets = np.asarray(swarmplots.collections[i].get_offsets())
 
             if len(label_df) == len(offsets):
-                label_df.loc[:, 'plotted_metric'] = [tup[0] for tup in offsets]
-                label_df.loc[:, 'y'] = [tup[1] for tup in offsets]
+                label_df = label_df.assign(plotted_metric=offsets[:, 0], y=offsets[:, 1])
 
                 # Add texts for target & comparison players.
-                texts = [ax.text(label_df[x_metric].iloc[i],
-                                 label_df['y'].iloc[i],
-                                 str(label_df[data_point_label].iloc[i]),
-                                 color='#0C1B37',
-                                 fontsize=5,
-                                 fontweight='bold',
-                                 zorder=6,
-                                 path_effects=[pe.withStroke(linewidth=1,
-                                                             foreground='white',
-                                                             alpha=1)]
-                                 ) for i in range(len(label_df))]
+                rows = label_df[[x_metric, 'y', data_point_label]].itertuples(index=False)
+                texts = [ax.text(x, y, str(label), **text_style) for x, y, label in rows]
 
                 # Plot texts using adjust_text - only adjust spacing in y-axis.
                 adjust_text(texts,
                             ax=ax,
-                            add_objects=[artists[i]],
-                            expand_points=(1, 3),
-                            expand_objects=(1, 3),
-                            expand_text=(1, 3),
-                            force_objects=.75,
-                            force_points=.75,
+                            objects=artists[i],
+                            expand=(1, 3),
+                            force_static=.75,
                             force_text=.75,
-                            only_move=dict(points='y', text='y', objects='y'),
-                            autoalign='y',
+                            only_move=dict(text='y', static='y', explode='y', pull='y'),
                             arrowprops=dict(arrowstyle="-",
                                             color='#0C1B37',
                                             alpha=1,
@@ -691,9 +750,7 @@ def plot_swarm_violin(df,
                        fontweight='bold')
 
     # Setting x-axis value unit if specified.
-    if x_unit is not None:
-        formatter0 = EngFormatter(unit=x_unit)
-        ax.xaxis.set_major_formatter(formatter0)
+    _set_unit_formatter(ax.xaxis, x_unit)
 
     # Setting plot spines to #0C1B37 or none.
     ax.spines['top'].set_color('none')
@@ -719,7 +776,7 @@ def plot_swarm_violin(df,
     # Remove legend.
     ax.legend().remove()
 
-    plt.tight_layout()
+    fig.tight_layout()
     plt.show()
 
     return fig, ax